@@ -1,5 +1,17 @@
-from . import mt19937_cracker
-from . import v8_cracker
-from . import v8_cracker_int
-from . import v8_cracker_int_legacy
-from . import v8_cracker_legacy
+import importlib
+
+# Cracker modules are imported on first access so that, for example, using only
+# the MT19937 cracker does not load z3.
+_SUBMODULES = (
+    "mt19937_cracker",
+    "v8_cracker",
+    "v8_cracker_int",
+    "v8_cracker_int_legacy",
+    "v8_cracker_legacy",
+)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,7 @@
+import sys
 from _random import Random
+from array import array
+from collections.abc import Iterable
 
 from crackers.random_cracker import (
     NotEnoughDataError,
@@ -25,6 +28,12 @@ TEMPERING_S, TEMPERING_B = 7, 0x9D2C5680
 TEMPERING_T, TEMPERING_C = 15, 0xEFC60000
 TEMPERING_L = 18
 
+# Masks for undoing the left-shift tempering steps. Undoing `y ^= (y << s) & m`
+# leaves `y ^= (y << 2s) & (m & (m << s))` behind, so the mask narrows every time
+# the shift doubles. For TEMPERING_C the first narrowed mask is already zero.
+TEMPERING_B2 = TEMPERING_B & (TEMPERING_B << TEMPERING_S)  # 0x94284000
+TEMPERING_B4 = TEMPERING_B2 & (TEMPERING_B2 << 2 * TEMPERING_S)  # 0x10000000
+
 # Constants for generating 53-bit random floats in [0.0, 1.0)
 # These are used in the `random()` method to match CPython's behavior.
 RANDOM_SHIFT_A = 5
@@ -46,7 +55,8 @@ class MT19937Cracker(RandomCracker):
     def __init__(self):
         """Initializes the cracker with an empty state."""
         self._status = SolverStatus.SOLVING
-        self._state = []
+        self._state = array("I", [0]) * N
+        self._state_len = 0
         self._random: Random | None = None
 
     @property
@@ -60,8 +70,37 @@ class MT19937Cracker(RandomCracker):
         Args:
             new_value: The 32-bit integer output from `random.getrandbits(32)`.
         """
-        handler = self._get_state_handler()
-        handler(new_value)
+        match self.status:
+            case SolverStatus.SOLVING:
+                self._handle_solving(new_value)
+            case SolverStatus.SOLVED:
+                self._handle_solved(new_value)
+            case _:
+                self._handle_not_solvable(new_value)
+
+    def add_values(self, new_values: Iterable[int]):
+        """Adds a sequence of observed values from the random number generator.
+
+        Values are collected one by one until the state is solved. Any values left
+        after that are validated together against a single `getrandbits` call on
+        the reconstructed generator.
+
+        Args:
+            new_values: The 32-bit integer outputs from `random.getrandbits(32)`.
+        """
+        new_values = list(new_values)
+        if self.status == SolverStatus.SOLVING:
+            num_missing = N - self._state_len
+            for new_value in new_values[:num_missing]:
+                self._handle_solving(new_value)
+            new_values = new_values[num_missing:]
+        if not new_values:
+            return
+        match self.status:
+            case SolverStatus.SOLVED:
+                self._handle_solved_batch(new_values)
+            case _:
+                self._handle_not_solvable(new_values[0])
 
     def predict_next(self) -> int:
         """Predicts the next 32-bit integer from the sequence.
@@ -81,15 +120,27 @@ class MT19937Cracker(RandomCracker):
             case _:
                 raise NotSolvableError()
 
-    # --- State Handlers ---
+    def predict_many(self, count: int) -> list[int]:
+        """Predicts the next `count` 32-bit integers from the sequence.
+
+        Once the state is solved, all values are produced by a single `getrandbits`
+        call on the reconstructed generator.
+
+        Args:
+            count: The number of values to predict.
 
-    def _get_state_handler(self):
-        """Returns the appropriate handler method based on the current solver status."""
-        return {
-            SolverStatus.SOLVING: self._handle_solving,
-            SolverStatus.SOLVED: self._handle_solved,
-            SolverStatus.NOT_SOLVABLE: self._handle_not_solvable,
-        }[self.status]
+        Raises:
+            NotEnoughDataError: If the cracker does not have enough data to predict.
+            NotSolvableError: If the provided data is inconsistent.
+
+        Returns:
+            A list of the next predicted 32-bit integers.
+        """
+        if count <= 0 or self.status != SolverStatus.SOLVED:
+            return super().predict_many(count)
+        return self._next_outputs(count)
+
+    # --- State Handlers ---
 
     def _handle_solving(self, new_value: int):
         """Handles a new value when the solver is still collecting data.
@@ -97,9 +148,10 @@ class MT19937Cracker(RandomCracker):
         This method untempers the value, adds it to the internal state, and transitions
         to the SOLVED status once enough data (N values) has been collected.
         """
-        self._state.append(self._untemper(new_value))
-        if len(self._state) == N:
-            self._random = self._create_random(tuple(self._state + [N]))
+        self._state[self._state_len] = self._untemper(new_value)
+        self._state_len += 1
+        if self._state_len == N:
+            self._random = self._create_random(tuple(self._state) + (N,))
             self._status = SolverStatus.SOLVED
 
     def _handle_solved(self, new_value: int):
@@ -113,12 +165,36 @@ class MT19937Cracker(RandomCracker):
             self._status = SolverStatus.NOT_SOLVABLE
             raise NotSolvableError()
 
+    def _handle_solved_batch(self, new_values: list[int]):
+        """Handles several new values at once when the solver is in the SOLVED state.
+
+        The whole batch is validated against the reconstructed generator at once. If
+        any value does not match, the state becomes NOT_SOLVABLE.
+        """
+        if self._next_outputs(len(new_values)) != new_values:
+            self._status = SolverStatus.NOT_SOLVABLE
+            raise NotSolvableError()
+
     def _handle_not_solvable(self, new_value: int):
         """Handles a new value when the solver is in a NOT_SOLVABLE state."""
         raise NotSolvableError()
 
     # --- Internal Helper Methods ---
 
+    def _next_outputs(self, count: int) -> list[int]:
+        """Returns the next `count` 32-bit outputs of the reconstructed generator.
+
+        `getrandbits(32 * count)` packs the next `count` 32-bit outputs into one
+        integer, least significant word first, so they come from a single call.
+        """
+        outputs = array("I")
+        outputs.frombytes(
+            self._random.getrandbits(32 * count).to_bytes(4 * count, "little")
+        )
+        if sys.byteorder == "big":
+            outputs.byteswap()
+        return outputs.tolist()
+
     @classmethod
     def _create_random(cls, state) -> Random:
         """Creates a `_random.Random` instance from a given state tuple."""
@@ -128,39 +204,22 @@ class MT19937Cracker(RandomCracker):
 
     @classmethod
     def _untemper(cls, y):
-        """Reverses the tempering function of MT19937 to find the raw state."""
-        y = cls._untemper_right_shift(y, TEMPERING_L)
-        y = cls._untemper_left_shift(y, TEMPERING_T, TEMPERING_C)
-        y = cls._untemper_left_shift(y, TEMPERING_S, TEMPERING_B)
-        y = cls._untemper_right_shift(y, TEMPERING_U, TEMPERING_D)
-        return y
-
-    @classmethod
-    def _untemper_right_shift(cls, y, shift, mask=UINT32_MASK):
-        """Reverses a right-shift tempering operation: y ^= (y >> shift) & mask.
+        """Reverses the tempering function of MT19937 to find the raw state.
 
-        The reversal works by iteratively reconstructing the original bits. Since the
-        right shift moves higher-order bits into lower-order positions, we can start
-        with the most significant bits (which are unchanged) and use them to recover
-        the next set of bits, repeating until all bits are recovered.
+        Each tempering step `y ^= (y >> shift) & mask` is undone by applying it
+        again with the shift doubled and the mask narrowed, until the shift covers
+        all 32 bits. Since the shifts and masks are fixed, the steps are written out
+        in full, undoing the tempering steps in reverse order.
         """
-        res = y
-        # Iterate enough times to ensure all bits have been corrected.
-        for _ in range(32 // shift + 1):
-            res = y ^ ((res >> shift) & mask)
-        return res
-
-    @classmethod
-    def _untemper_left_shift(cls, y, shift, mask):
-        """Reverses a left-shift tempering operation: y ^= (y << shift) & mask.
-
-        Similar to the right-shift reversal, this works by iteratively reconstructing
-        the original bits. We start with the least significant bits (which are
-        unchanged) and use them to recover the next set of bits, repeating until
-        the full number is recovered.
-        """
-        res = y
-        # Iterate enough times to ensure all bits have been corrected.
-        for _ in range(32 // shift + 1):
-            res = y ^ ((res << shift) & mask)
-        return res
+        # y ^= y >> 18
+        y ^= y >> TEMPERING_L
+        # y ^= (y << 15) & 0xEFC60000
+        y ^= (y << TEMPERING_T) & TEMPERING_C
+        # y ^= (y << 7) & 0x9D2C5680
+        y ^= (y << TEMPERING_S) & TEMPERING_B
+        y ^= (y << 2 * TEMPERING_S) & TEMPERING_B2
+        y ^= (y << 4 * TEMPERING_S) & TEMPERING_B4
+        # y ^= y >> 11
+        y ^= y >> TEMPERING_U
+        y ^= y >> 2 * TEMPERING_U
+        return y
@@ -9,7 +9,9 @@ Supported PRNGs:
 - CPython's `random` module (Mersenne Twister MT19937).
 """
 
+import importlib
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from enum import Enum, auto
 
 
@@ -49,6 +51,17 @@ class SolverStatus(Enum):
     """V8 only: A cache refill was detected, invalidating the current solving process."""
 
 
+# The module and class name of the cracker for each `RngType`. `RandomCracker.create`
+# only imports the module it needs, so the z3-based V8 crackers are never loaded
+# when cracking MT19937.
+_CRACKER_CLASSES = {
+    RngType.V8: ("crackers.v8_cracker", "V8Cracker"),
+    RngType.V8_INT: ("crackers.v8_cracker_int_legacy", "V8IntCracker"),
+    RngType.V8_LEGACY: ("crackers.v8_cracker_legacy", "V8CrackerLegacy"),
+    RngType.MT19937: ("crackers.mt19937_cracker", "MT19937Cracker"),
+}
+
+
 class NotSolvableError(RuntimeError):
     """Raised when a PRNG state cannot be solved with the given values."""
 
@@ -73,20 +86,17 @@ class RandomCracker(ABC):
     def create(rng_type: RngType, **kwargs) -> "RandomCracker":
         """Creates a `RandomCracker` instance for the specified `RngType`.
 
-        This factory method performs a depth-first search through the subclass tree
-        to find a cracker with a matching `rng_type`.
+        This factory method imports the module defining the requested cracker and
+        instantiates its cracker class, independently of what else was imported.
         """
-        # Use an iterative DFS to find the correct subclass.
-        classes_to_visit = list(RandomCracker.__subclasses__())
-        while classes_to_visit:
-            cls = classes_to_visit.pop()
-            # If the class itself doesn't have the rng_type, it might be an abstract
-            # base for other crackers (e.g., V8Cracker).
-            if getattr(cls, "rng_type") == rng_type:
-                return cls(**kwargs)
-            classes_to_visit.extend(cls.__subclasses__())
-
-        raise ValueError(f"No cracker available for the specified RNG type: {rng_type}")
+        try:
+            module_name, class_name = _CRACKER_CLASSES[rng_type]
+        except KeyError:
+            raise ValueError(
+                f"No cracker available for the specified RNG type: {rng_type}"
+            ) from None
+        cls = getattr(importlib.import_module(module_name), class_name)
+        return cls(**kwargs)
 
     @property
     @abstractmethod
@@ -105,6 +115,22 @@ class RandomCracker(ABC):
             None
         """
 
+    def add_values(self, values: Iterable) -> None:
+        """
+        Adds a sequence of observed values from the PRNG, in order.
+
+        Subclasses may override this to process the values more efficiently than
+        calling `add_value` for each of them.
+
+        Args:
+            values: The observed values from the PRNG.
+
+        Returns:
+            None
+        """
+        for value in values:
+            self.add_value(value)
+
     @abstractmethod
     def predict_next(self):
         """
@@ -119,3 +145,22 @@ class RandomCracker(ABC):
         Returns:
             The predicted next value.
         """
+
+    def predict_many(self, count: int) -> list:
+        """
+        Predicts the next `count` values from the PRNG, in order.
+
+        Subclasses may override this to produce the values more efficiently than
+        calling `predict_next` for each of them.
+
+        Args:
+            count: The number of values to predict.
+
+        Raises:
+            NotEnoughDataError: If the state has not been solved yet.
+            NotSolvableError: If the provided data is inconsistent.
+
+        Returns:
+            A list of the predicted values.
+        """
+        return [self.predict_next() for _ in range(count)]
@@ -15,8 +15,17 @@ methods used across V8 versions.
 """
 
 from abc import ABC, abstractmethod
-
-from z3 import BitVec, LShR, SolverFor, sat, set_param, unsat
+from typing import ClassVar
+
+from z3 import (
+    BitVec,
+    Extract,
+    LShR,
+    SolverFor,
+    sat,
+    set_param,
+    unsat,
+)
 
 from crackers.random_cracker import (
     NotEnoughDataError,
@@ -32,6 +41,9 @@ UINT64_MASK = (1 << 64) - 1  # 0xFFFFFFFFFFFFFFFF
 # Constant for 2^53, used in the division-based conversion method.
 TWO_POW_53 = 1 << 53  # 0x20000000000000
 
+# 2^-53 is exactly representable, so multiplying by it is identical to dividing by 2^53.
+INV_TWO_POW_53 = 2.0**-53
+
 # V8's PRNG uses a cache of 64 values that is refilled periodically.
 CACHE_REFILL_SIZE = 64
 
@@ -39,9 +51,14 @@ CACHE_REFILL_SIZE = 64
 class RNGStateConverter(ABC):
     """An abstract base class for converting between PRNG state and double-precision floats."""
 
+    __slots__ = ()
+
+    # Number of low state bits that do not make it into the generated value.
+    IGNORED_LOWER_BITS: ClassVar[int]
+
     @classmethod
-    @abstractmethod
-    def get_ignored_lower_bits(cls) -> int: ...
+    def get_ignored_lower_bits(cls) -> int:
+        return cls.IGNORED_LOWER_BITS
 
     @classmethod
     @abstractmethod
@@ -58,19 +75,19 @@ class DivisionConverter(RNGStateConverter):
     This method is used in modern versions of V8.
     """
 
-    @classmethod
-    def get_ignored_lower_bits(cls) -> int:
-        return 11
+    __slots__ = ()
+
+    IGNORED_LOWER_BITS = 11
 
     @classmethod
     def to_value(cls, state: int) -> float:
-        state_upper_53_bits = state >> cls.get_ignored_lower_bits()
-        return float(state_upper_53_bits) / TWO_POW_53
+        state_upper_53_bits = state >> cls.IGNORED_LOWER_BITS
+        return state_upper_53_bits * INV_TWO_POW_53
 
     @classmethod
     def from_value(cls, value: float) -> int:
         state_upper_53_bits = int(value * TWO_POW_53)
-        recovered_state = state_upper_53_bits << cls.get_ignored_lower_bits()
+        recovered_state = state_upper_53_bits << cls.IGNORED_LOWER_BITS
         return recovered_state & UINT64_MASK
 
 
@@ -91,10 +108,96 @@ class XorShift128PlusUtil:
     def previous_state(cls, s0_next: int, s1_next: int) -> tuple[int, int]:
         s1_prev = s0_next
         temp = s1_next ^ s1_prev ^ (s1_prev >> 26)
-        temp = temp ^ (temp >> 17) ^ (temp >> 34) ^ (temp >> 51)
-        s0_prev = (temp ^ (temp << 23) ^ (temp << 46)) & UINT64_MASK
+        # Undo the xorshifts by log-stepping, doubling the shift each time.
+        temp ^= temp >> 17
+        temp ^= temp >> 34
+        temp ^= temp << 23
+        temp ^= temp << 46
+        s0_prev = temp & UINT64_MASK
         return s0_prev, s1_prev
 
+    # Byte-indexed lookup tables for `jump_cache_refill`, built on first use.
+    _cache_refill_jump_tables: list[list[int]] | None = None
+
+    @classmethod
+    def jump_cache_refill(cls, s0: int, s1: int) -> tuple[int, int]:
+        """Advances the state past a cache refill (`CACHE_REFILL_SIZE * 2` steps).
+
+        xorshift128+ is linear over GF(2), so the jump is a fixed 128x128 bit
+        matrix. It is applied to the 128-bit state one byte at a time, looking up
+        the XOR of the matrix columns selected by each byte.
+        """
+        tables = cls._cache_refill_jump_tables or cls._build_cache_refill_jump_tables()
+        state = (s0 << 64) | s1
+        jumped = 0
+        for table in tables:
+            jumped ^= table[state & 0xFF]
+            state >>= 8
+        return jumped >> 64, jumped & UINT64_MASK
+
+    @classmethod
+    def _build_cache_refill_jump_tables(cls) -> list[list[int]]:
+        columns = cls._matrix_columns(
+            lambda s0, s1: cls.jump(s0, s1, CACHE_REFILL_SIZE * 2)
+        )
+        tables = []
+        for offset in range(0, 128, 8):
+            table = [0] * 256
+            for byte in range(1, 256):
+                lowest_bit = (byte & -byte).bit_length() - 1
+                table[byte] = table[byte & (byte - 1)] ^ columns[offset + lowest_bit]
+            tables.append(table)
+        cls._cache_refill_jump_tables = tables
+        return tables
+
+    # Transition matrices T^(2^i) and T^-(2^i) for `jump`, each as a list of 128
+    # columns, squared into existence as larger powers are needed.
+    _forward_powers: list[list[int]] = []
+    _backward_powers: list[list[int]] = []
+
+    @classmethod
+    def jump(cls, s0: int, s1: int, steps: int) -> tuple[int, int]:
+        """Advances the state by `steps` steps, or goes back if `steps` is negative.
+
+        The transition is linear over GF(2), so this takes O(log |steps|) bit
+        matrix applications instead of |steps| single steps.
+        """
+        if steps >= 0:
+            powers, step = cls._forward_powers, cls.next_state
+        else:
+            powers, step, steps = cls._backward_powers, cls.previous_state, -steps
+        while len(powers) < steps.bit_length():
+            if powers:
+                square = powers[-1]
+                powers.append([cls._apply_matrix(square, col) for col in square])
+            else:
+                powers.append(cls._matrix_columns(step))
+        state = (s0 << 64) | s1
+        for i in range(steps.bit_length()):
+            if steps >> i & 1:
+                state = cls._apply_matrix(powers[i], state)
+        return state >> 64, state & UINT64_MASK
+
+    @staticmethod
+    def _matrix_columns(transform) -> list[int]:
+        # The columns of the bit matrix of a GF(2)-linear state transform, with each
+        # state packed as `s0 << 64 | s1`.
+        columns = []
+        for bit in range(128):
+            basis = 1 << bit
+            s0, s1 = transform(basis >> 64, basis & UINT64_MASK)
+            columns.append((s0 << 64) | s1)
+        return columns
+
+    @staticmethod
+    def _apply_matrix(columns: list[int], state: int) -> int:
+        result = 0
+        while state:
+            lowest_bit = state & -state
+            result ^= columns[lowest_bit.bit_length() - 1]
+            state ^= lowest_bit
+        return result
+
 
 class V8Cracker(RandomCracker):
     """Cracks V8's `Math.random()` by incrementally solving for its state.
@@ -132,8 +235,11 @@ class V8Cracker(RandomCracker):
         self._solver = SolverFor("QF_BV")
 
         self._solver.push()  # For lightweight solver resets
-        self._s0_sym = BitVec("s0", 64)
-        self._s1_sym = BitVec("s1", 64)
+        # Symbolic states indexed by the number of rotations applied, so that the
+        # replay in `_pop_oldest_constraint` reuses the expressions built before.
+        self._symbolic_states = [(BitVec("s0", 64), BitVec("s1", 64))]
+        self._num_symbolic_rotations = 0
+        self._s0_sym, self._s1_sym = self._symbolic_states[0]
         self._s0_val: int = 0
         self._s1_val: int = 0
         self._cache_refill_counter: int = 0
@@ -145,37 +251,93 @@ class V8Cracker(RandomCracker):
 
     def add_value(self, new_value: float) -> None:
         self._observed_values.append(new_value)
-        handler = self._get_state_handler()
-        handler(new_value)
+        match self.status:
+            case SolverStatus.SOLVING:
+                self._handle_solving(new_value)
+            case SolverStatus.CACHE_REFILLED_WHILE_SOLVING:
+                self._handle_cache_refilled_while_solving(new_value)
+            case SolverStatus.SOLVED_BEFORE_CACHE_REFILL:
+                self._handle_solved_before_cache_refill(new_value)
+            case SolverStatus.SOLVED:
+                self._handle_solved(new_value)
+            case _:
+                self._handle_not_solvable(new_value)
 
     def predict_next(self) -> float:
         match self.status:
             case SolverStatus.SOLVING | SolverStatus.CACHE_REFILLED_WHILE_SOLVING:
                 raise NotEnoughDataError()
             case SolverStatus.SOLVED_BEFORE_CACHE_REFILL:
-                result = self._peek_next_prediction()
-                self._rotate_state()
-                return result
+                return self._pop_next_prediction()
             case SolverStatus.SOLVED:
                 self._cache_refill_counter -= 1
                 if self._cache_refill_counter == 0:
                     self._handle_cache_refill()
-                result = self._peek_next_prediction()
-                self._rotate_state()
-                return result
+                return self._pop_next_prediction()
             case SolverStatus.NOT_SOLVABLE:
                 raise NotSolvableError()
 
-    # --- State Handlers ---
+    def predict_at(self, index: int) -> float:
+        """Predicts the value `index` positions ahead without consuming any.
+
+        `predict_at(0)` is the value the next `predict_next` call would return. The
+        state is skipped ahead in O(log index) instead of stepping through every
+        value in between.
+
+        Raises:
+            ValueError: If `index` is negative.
+            NotEnoughDataError: If the state has not been solved yet.
+            NotSolvableError: If the provided data is inconsistent.
+        """
+        if index < 0:
+            raise ValueError(f"index must be non-negative, got {index}")
+        match self.status:
+            case SolverStatus.SOLVING | SolverStatus.CACHE_REFILLED_WHILE_SOLVING:
+                raise NotEnoughDataError()
+            case SolverStatus.NOT_SOLVABLE:
+                raise NotSolvableError()
+            case SolverStatus.SOLVED_BEFORE_CACHE_REFILL:
+                num_cache_refills = 0
+            case SolverStatus.SOLVED:
+                # Refills happen right before the values at positions c - 1, c + 63,
+                # ... where c is the current cache refill counter.
+                values_after_refill = index + 1 - self._cache_refill_counter
+                num_cache_refills = max(0, values_after_refill // CACHE_REFILL_SIZE + 1)
+        # Values are served backwards from the cache, and each refill moves the
+        # state forwards past the cache just served and the one about to be.
+        s0, _ = XorShift128PlusUtil.jump(
+            self._s0_val,
+            self._s1_val,
+            num_cache_refills * CACHE_REFILL_SIZE * 2 - index,
+        )
+        return self.converter.to_value(s0)
+
+    def predict_many(self, count: int) -> list:
+        """Predicts the next `count` values from the sequence.
+
+        Once the cache has been refilled, the state is stepped in a local loop
+        instead of going through `predict_next` for every value.
+        """
+        if count <= 0 or self.status != SolverStatus.SOLVED:
+            return super().predict_many(count)
+        previous_state = XorShift128PlusUtil.previous_state
+        jump_cache_refill = XorShift128PlusUtil.jump_cache_refill
+        to_value = self.converter.to_value
+        s0, s1 = self._s0_val, self._s1_val
+        cache_refill_counter = self._cache_refill_counter
+        predictions = []
+        for _ in range(count):
+            cache_refill_counter -= 1
+            if cache_refill_counter == 0:
+                s0, s1 = jump_cache_refill(s0, s1)
+                cache_refill_counter = CACHE_REFILL_SIZE
+            predictions.append(to_value(s0))
+            s0, s1 = previous_state(s0, s1)
+        self._s0_val, self._s1_val = s0, s1
+        self._cache_refill_counter = cache_refill_counter
+        return predictions
 
-    def _get_state_handler(self):
-        return {
-            SolverStatus.SOLVING: self._handle_solving,
-            SolverStatus.CACHE_REFILLED_WHILE_SOLVING: self._handle_cache_refilled_while_solving,
-            SolverStatus.SOLVED_BEFORE_CACHE_REFILL: self._handle_solved_before_cache_refill,
-            SolverStatus.SOLVED: self._handle_solved,
-            SolverStatus.NOT_SOLVABLE: self._handle_not_solvable,
-        }[self.status]
+    # --- State Handlers ---
 
     def _handle_solving(self, new_value: float):
         if self._is_prediction_correct(new_value):
@@ -183,10 +345,11 @@ class V8Cracker(RandomCracker):
             self._status = SolverStatus.SOLVED_BEFORE_CACHE_REFILL
         else:
             self._add_constraint(new_value)
-            if self._solver.check() == unsat:
+            result = self._solver.check()
+            if result == unsat:
                 print("warning: cache refilling detected")
                 self._status = SolverStatus.CACHE_REFILLED_WHILE_SOLVING
-            elif self._solver.check() == sat:
+            elif result == sat:
                 self._update_state_from_model()
             else:
                 print("warning: give up because of timeout")
@@ -200,9 +363,12 @@ class V8Cracker(RandomCracker):
             self._status = SolverStatus.SOLVED
         else:
             self._add_constraint(new_value)
-            while self._solver.check() != sat:
+            while (result := self._solver.check()) == unsat:
                 self._pop_oldest_constraint()
-            self._update_state_from_model()
+            if result == sat:
+                self._update_state_from_model()
+            else:
+                print("warning: give up because of timeout")
 
     def _handle_solved_before_cache_refill(self, new_value: float):
         if self._is_prediction_correct(new_value):
@@ -231,19 +397,22 @@ class V8Cracker(RandomCracker):
     # --- Internal Helper Methods ---
 
     def _add_constraint(self, new_val: float):
-        shift = self.converter.get_ignored_lower_bits()
-        known_bits = self.converter.from_value(new_val) >> shift
-        self._solver.add(LShR(self._s0_sym, shift) == known_bits)
+        converter = self.converter
+        shift = converter.IGNORED_LOWER_BITS
+        known_bits = converter.from_value(new_val) >> shift
+        # Equate the known upper bits directly rather than through a 64-bit shift.
+        self._solver.add(Extract(63, shift, self._s0_sym) == known_bits)
         self._rotate_symbolic_state()
 
     def _pop_oldest_constraint(self) -> None:
-        # reset the solver
+        # Reset the solver and recover the remaining constraints starting from the
+        # unrotated state. Merely disabling the oldest one would leave the rest as
+        # deep rotations of the state variables, which Z3 then fails to solve in time.
         self._solver.pop()
         self._solver.push()
-        # recover the constraints except the oldest one
-        self._s0_sym = BitVec("s0", 64)
-        self._s1_sym = BitVec("s1", 64)
-        self._observed_values = self._observed_values[1:]
+        self._num_symbolic_rotations = 0
+        self._s0_sym, self._s1_sym = self._symbolic_states[0]
+        del self._observed_values[0]
         for val in self._observed_values:
             self._add_constraint(val)
 
@@ -259,21 +428,30 @@ class V8Cracker(RandomCracker):
         )
 
     def _rotate_symbolic_state(self):
-        self._s1_sym, temp = self._s0_sym, self._s1_sym
-        temp ^= self._s1_sym ^ LShR(self._s1_sym, 26)
-        temp ^= LShR(temp, 17) ^ LShR(temp, 34) ^ LShR(temp, 51)
-        temp ^= (temp << 23) ^ (temp << 46)
-        self._s0_sym = temp
+        self._num_symbolic_rotations += 1
+        if self._num_symbolic_rotations == len(self._symbolic_states):
+            s1, temp = self._s0_sym, self._s1_sym
+            temp ^= s1 ^ LShR(s1, 26)
+            temp ^= LShR(temp, 17) ^ LShR(temp, 34) ^ LShR(temp, 51)
+            temp ^= (temp << 23) ^ (temp << 46)
+            self._symbolic_states.append((temp, s1))
+        self._s0_sym, self._s1_sym = self._symbolic_states[self._num_symbolic_rotations]
 
     def _peek_next_prediction(self) -> float:
         return self.converter.to_value(self._s0_val)
 
+    def _pop_next_prediction(self) -> float:
+        s0 = self._s0_val
+        self._s0_val, self._s1_val = XorShift128PlusUtil.previous_state(
+            s0, self._s1_val
+        )
+        return self.converter.to_value(s0)
+
     def _is_prediction_correct(self, new_value: float) -> bool:
         return self._peek_next_prediction() == new_value
 
     def _handle_cache_refill(self) -> None:
-        for _ in range(CACHE_REFILL_SIZE * 2):
-            self._s0_val, self._s1_val = XorShift128PlusUtil.next_state(
-                self._s0_val, self._s1_val
-            )
+        self._s0_val, self._s1_val = XorShift128PlusUtil.jump_cache_refill(
+            self._s0_val, self._s1_val
+        )
         self._cache_refill_counter = CACHE_REFILL_SIZE
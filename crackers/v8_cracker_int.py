@@ -1,10 +1,12 @@
 from z3 import LShR
 
-from crackers.random_cracker import RandomCracker, RngType
+from crackers.random_cracker import RngType
 from crackers.v8_cracker import DivisionConverter, V8Cracker
 
 
 class V8IntConverter(DivisionConverter):
+    __slots__ = ("_multiplier",)
+
     def __init__(self, multiplier: int):
         self._multiplier = multiplier
 
@@ -21,15 +23,16 @@ class V8IntCracker(V8Cracker):
 
     def __init__(self, multiplier: int):
         super().__init__()
-        self._multiplier = multiplier
         self.converter = V8IntConverter(multiplier)
 
     def _add_constraint(self, new_val: int):
-        known_bits_lower = self.converter.from_value(new_val)
-        known_bits_upper = self.converter.from_value(new_val + 1)
-        shift = self.converter.get_ignored_lower_bits()
-        self._solver.add(known_bits_lower >> shift <= LShR(self._s0_sym, shift))
-        self._solver.add(LShR(self._s0_sym, shift) <= known_bits_upper >> shift)
+        converter = self.converter
+        known_bits_lower = converter.from_value(new_val)
+        known_bits_upper = converter.from_value(new_val + 1)
+        shift = converter.IGNORED_LOWER_BITS
+        s0_upper_bits = LShR(self._s0_sym, shift)
+        self._solver.add(known_bits_lower >> shift <= s0_upper_bits)
+        self._solver.add(s0_upper_bits <= known_bits_upper >> shift)
         self._rotate_symbolic_state()
 
 
@@ -39,7 +42,7 @@ if __name__ == "__main__":
     multiplier = 2**32
     multiplier = 4_444_444_444
 
-    cracker = RandomCracker.create(RngType.V8_INT, multiplier=multiplier)
+    cracker = V8IntCracker(multiplier)
     seq = [
         0.14125615467524433,
         0.26338755919900825,
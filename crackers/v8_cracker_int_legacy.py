@@ -1,10 +1,12 @@
 from z3 import LShR
 
-from crackers.random_cracker import RandomCracker, RngType
+from crackers.random_cracker import RngType
 from crackers.v8_cracker import DivisionConverter, V8Cracker
 
 
 class V8IntConverter(DivisionConverter):
+    __slots__ = ("_multiplier",)
+
     def __init__(self, multiplier: int):
         self._multiplier = multiplier
 
@@ -21,16 +23,15 @@ class V8IntCracker(V8Cracker):
 
     def __init__(self, multiplier: int):
         super().__init__()
-        self._multiplier = multiplier
         self.converter = V8IntConverter(multiplier)
 
     def _add_constraint(self, new_val: int):
-        shift = self.converter.get_ignored_lower_bits()
-        known_bits_lower = self.converter.from_value(new_val)
-        known_bits_upper = self.converter.from_value(new_val + 1)
-        i = shift
-        while known_bits_lower >> i != known_bits_upper >> i:
-            i += 1
+        converter = self.converter
+        shift = converter.IGNORED_LOWER_BITS
+        known_bits_lower = converter.from_value(new_val)
+        known_bits_upper = converter.from_value(new_val + 1)
+        # Only the bits above the highest differing bit are shared by the whole range.
+        i = max(shift, (known_bits_lower ^ known_bits_upper).bit_length())
         self._solver.add(LShR(self._s0_sym, i) == known_bits_lower >> i)
         self._rotate_symbolic_state()
 
@@ -38,7 +39,7 @@ class V8IntCracker(V8Cracker):
 if __name__ == "__main__":
     multiplier = 2**32
 
-    cracker = RandomCracker.create(RngType.V8_INT, multiplier=multiplier)
+    cracker = V8IntCracker(multiplier)
     seq = [
         0.14125615467524433,
         0.26338755919900825,
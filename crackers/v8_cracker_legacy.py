@@ -1,10 +1,10 @@
-import struct
-
 from crackers.v8_cracker import UINT64_MASK, RNGStateConverter, RngType, V8Cracker
 
-# The exponent part of a double-precision float representing 1.0.
-# This is used for converting between integer states and doubles.
-EXPONENT_MASK = struct.unpack("<Q", struct.pack("<d", 1.0))[0]  # 0x3FF0000000000000
+# Constant for 2^52, the scale of the 52-bit mantissa of a double in [1.0, 2.0).
+TWO_POW_52 = 1 << 52  # 0x10000000000000
+
+# 2^-52 is exactly representable, so multiplying by it is identical to dividing by 2^52.
+INV_TWO_POW_52 = 2.0**-52
 
 
 class BinaryCastConverter(RNGStateConverter):
@@ -13,24 +13,23 @@ class BinaryCastConverter(RNGStateConverter):
     This method is used in older versions of V8.
     """
 
-    @classmethod
-    def get_ignored_lower_bits(cls) -> int:
-        return 12
+    __slots__ = ()
+
+    IGNORED_LOWER_BITS = 12
 
     @classmethod
     def to_value(cls, state: int) -> float:
-        state_upper_52_bits = state >> cls.get_ignored_lower_bits()
-        state_with_exponent = state_upper_52_bits | EXPONENT_MASK
-        packed = struct.pack("<Q", state_with_exponent)
-        random_double = struct.unpack("<d", packed)[0]
-        return random_double - 1.0
+        # Casting the upper 52 bits under the exponent of 1.0 gives 1 + bits / 2^52,
+        # and subtracting 1.0 from that is exact, so scaling by 2^-52 is identical.
+        state_upper_52_bits = state >> cls.IGNORED_LOWER_BITS
+        return state_upper_52_bits * INV_TWO_POW_52
 
     @classmethod
     def from_value(cls, value: float) -> int:
-        value_plus_one = value + 1.0
-        packed = struct.pack("<d", value_plus_one)
-        state_with_exponent = struct.unpack("<Q", packed)[0]
-        recovered_state = state_with_exponent << cls.get_ignored_lower_bits()
+        # `value + 1.0` rounds to the nearest multiple of 2^-52, ties to even, which
+        # is exactly what `round` does to the (exact) product `value * 2^52`.
+        state_upper_52_bits = round(value * TWO_POW_52)
+        recovered_state = state_upper_52_bits << cls.IGNORED_LOWER_BITS
         return recovered_state & UINT64_MASK
 
 
@@ -58,6 +58,12 @@ def main():
         kwargs["multiplier"] = args.multiplier
     cracker = RandomCracker.create(rng_type, **kwargs)
 
+    # V8 and V8_LEGACY observe floats, the other crackers observe integers
+    if rng_type == RngType.V8 or rng_type == RngType.V8_LEGACY:
+        parse_value = float
+    else:
+        parse_value = int
+
     # Read and feed observed values from stdin, checking status after each
     try:
         for line in sys.stdin:
@@ -65,10 +71,7 @@ def main():
             if not line:
                 continue
             try:
-                if rng_type == RngType.V8 or rng_type == RngType.V8_LEGACY:
-                    val = float(line)
-                else:
-                    val = int(line)
+                val = parse_value(line)
             except ValueError:
                 print(f"Invalid input: {line}", file=sys.stderr)
                 parser.print_help()
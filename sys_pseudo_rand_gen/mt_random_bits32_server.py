@@ -0,0 +1,21 @@
+"""
+A script that serves sequences of pseudo-random 32-bit integers on request.
+
+This script is used by the test suite to generate live data from Python's
+`random.Random` class without starting a new interpreter for every sequence.
+Each line read from stdin is a count, and each count is answered with that many
+integers from a freshly seeded `random.Random`, one per line.
+
+Usage:
+    python mt_random_bits32_server.py
+"""
+
+import sys
+from random import Random
+
+
+if __name__ == "__main__":
+    for line in sys.stdin:
+        count = int(line)
+        rnd = Random()
+        print("\n".join(str(rnd.getrandbits(32)) for _ in range(count)), flush=True)
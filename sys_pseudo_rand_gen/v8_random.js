@@ -5,12 +5,37 @@
  * `Math.random()` function, which is typically implemented using V8's engine.
  *
  * @usage node pseudo_random.js [count]
+ * @usage node pseudo_random.js --serve
  *
  * @argument {number} [count=10] - The number of random floats to generate.
+ *
+ * With `--serve`, the script keeps running and reads one count per line from
+ * stdin. Each request is answered with that many floats, one per line, taken
+ * from a new context. Every context has its own freshly seeded `Math.random()`
+ * state, so each response matches what a newly started process would print.
  */
 
+const readline = require("node:readline");
+const vm = require("node:vm");
+
+function serve() {
+  const lines = readline.createInterface({ input: process.stdin });
+  lines.on("line", (line) => {
+    const random = vm.runInNewContext("Math.random");
+    let output = "";
+    for (let i = 0; i < Number(line); i++) {
+      output += `${random()}\n`;
+    }
+    process.stdout.write(output);
+  });
+}
+
 function main() {
   const [, , count = 10] = process.argv;
+  if (count === "--serve") {
+    serve();
+    return;
+  }
   for (let i = 0; i < Number(count); i++) {
     console.log(Math.random());
   }
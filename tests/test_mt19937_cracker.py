@@ -4,7 +4,7 @@ from random import Random
 
 import pytest
 
-from crackers.mt19937_cracker import N
+from crackers.mt19937_cracker import N, MT19937Cracker
 from crackers.random_cracker import (
     NotEnoughDataError,
     NotSolvableError,
@@ -14,6 +14,29 @@ from crackers.random_cracker import (
 )
 
 
+@pytest.fixture(scope="module")
+def live_bits32():
+    """Serves live 32-bit outputs generated by another Python process.
+
+    Starting a new interpreter for every repetition dominates the runtime of the
+    live-data tests, so one server process answers every request. Each request is
+    generated from a freshly seeded `random.Random`, just like a new process would.
+    """
+    with subprocess.Popen(
+        [sys.executable, "sys_pseudo_rand_gen/mt_random_bits32_server.py"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    ) as server:
+
+        def take(count):
+            server.stdin.write(f"{count}\n")
+            server.stdin.flush()
+            return [int(server.stdout.readline()) for _ in range(count)]
+
+        yield take
+
+
 @pytest.mark.repeat(10)
 def test_mt19937_cracker_predicts_future_outputs():
     """Verifies that the cracker can predict future outputs of a generator."""
@@ -33,8 +56,7 @@ def test_mt19937_cracker_predicts_future_outputs():
     cracker = RandomCracker.create(RngType.MT19937)
 
     # Add observed outputs to the cracker.
-    for val in observed_sequence:
-        cracker.add_value(val)
+    cracker.add_values(observed_sequence)
 
     # Verify that the cracker has solved the state.
     assert cracker.status == SolverStatus.SOLVED
@@ -45,23 +67,13 @@ def test_mt19937_cracker_predicts_future_outputs():
 
 
 @pytest.mark.repeat(10)
-def test_mt19937_cracker_with_live_data_bits32():
+def test_mt19937_cracker_with_live_data_bits32(live_bits32):
     """Verifies the cracker against live data from another Python process.
     This test provides strong evidence that the cracker works against a real-world Mersenne Twister implementation.
     """
-    # Generate N + 1000 random numbers from an external Python script.
+    # Take N + 1000 random numbers generated by an external Python script.
     num_to_generate = N + 1000
-    result = subprocess.run(
-        [
-            sys.executable,
-            "sys_pseudo_rand_gen/mt_random_bits32.py",
-            str(num_to_generate),
-        ],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    full_sequence = list(map(int, result.stdout.strip().split("\n")))
+    full_sequence = live_bits32(num_to_generate)
 
     # Consume some random numbers first to show that the predictor doesn't depend on the starting point of observation.
     full_sequence = full_sequence[full_sequence[0] % 100 :]
@@ -74,8 +86,7 @@ def test_mt19937_cracker_with_live_data_bits32():
     cracker = RandomCracker.create(RngType.MT19937)
 
     # Add observed outputs to the cracker.
-    for val in observed_sequence:
-        cracker.add_value(val)
+    cracker.add_values(observed_sequence)
 
     # Verify that the cracker has solved the state.
     assert cracker.status == SolverStatus.SOLVED
@@ -85,6 +96,56 @@ def test_mt19937_cracker_with_live_data_bits32():
     assert predictions == expected_predictions
 
 
+def test_mt19937_cracker_predict_many_matches_predict_next():
+    """Verifies that predict_many returns the same values as repeated predict_next."""
+    rnd = Random()
+    observed_sequence = [rnd.getrandbits(32) for _ in range(N)]
+
+    cracker_many = RandomCracker.create(RngType.MT19937)
+    cracker_next = RandomCracker.create(RngType.MT19937)
+    cracker_many.add_values(observed_sequence)
+    cracker_next.add_values(observed_sequence)
+
+    for count in [0, 1, 10, N + 1]:
+        predictions = [cracker_next.predict_next() for _ in range(count)]
+        assert cracker_many.predict_many(count) == predictions
+
+
+def test_mt19937_cracker_add_values():
+    """Verifies that values added in batches are collected and validated like single values."""
+    rnd = Random()
+    full_sequence = [rnd.getrandbits(32) for _ in range(N + 1000)]
+
+    cracker = RandomCracker.create(RngType.MT19937)
+    cracker.add_values(full_sequence[:100])
+    assert cracker.status == SolverStatus.SOLVING
+
+    # The batch crosses the point where the state is solved.
+    cracker.add_values(full_sequence[100 : N + 500])
+    assert cracker.status == SolverStatus.SOLVED
+    assert cracker.predict_next() == full_sequence[N + 500]
+
+    invalid_batch = full_sequence[N + 501 :]
+    invalid_batch[-1] ^= 1
+    with pytest.raises(
+        NotSolvableError, match="The PRNG state is not solvable with the given values."
+    ):
+        cracker.add_values(invalid_batch)
+    assert cracker.status == SolverStatus.NOT_SOLVABLE
+
+
+def test_untemper_inverts_tempering():
+    """Verifies that MT19937Cracker._untemper is the inverse of MT19937 tempering."""
+    rnd = Random(0)
+    for _ in range(10000):
+        y = rnd.getrandbits(32)
+        tempered = y ^ (y >> 11)
+        tempered ^= (tempered << 7) & 0x9D2C5680
+        tempered ^= (tempered << 15) & 0xEFC60000
+        tempered ^= tempered >> 18
+        assert MT19937Cracker._untemper(tempered) == y
+
+
 def test_not_enough_data_error():
     """Verifies that calling predict_next before the state is solved raises NotEnoughDataError."""
     cracker = RandomCracker.create(RngType.MT19937)
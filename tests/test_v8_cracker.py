@@ -1,9 +1,12 @@
+import random
+import struct
 import subprocess
 
 import pytest
 
 from crackers.random_cracker import RandomCracker, RngType, SolverStatus
 from crackers.v8_cracker import (
+    CACHE_REFILL_SIZE,
     UINT64_MASK,
     DivisionConverter,
     NotEnoughDataError,
@@ -13,6 +16,77 @@ from crackers.v8_cracker import (
 from crackers.v8_cracker_legacy import BinaryCastConverter
 
 
+def serve_v8_random(node_path):
+    """Runs v8_random.js in serve mode and yields a function returning live data.
+
+    Starting Node.js for every test dominates the runtime of the live-data tests.
+    In serve mode one process answers every request from a new context with a
+    freshly seeded `Math.random()`, just like a newly started process would.
+    """
+    process = subprocess.Popen(
+        [node_path, "sys_pseudo_rand_gen/v8_random.js", "--serve"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+    def generate(count):
+        process.stdin.write(f"{count}\n")
+        process.stdin.flush()
+        return [float(process.stdout.readline()) for _ in range(count)]
+
+    yield generate
+    process.stdin.close()
+    process.wait()
+
+
+@pytest.fixture(scope="module")
+def v8_random():
+    """Generates live `Math.random()` data with the installed Node.js."""
+    yield from serve_v8_random("node")
+
+
+@pytest.fixture(scope="module")
+def v8_random_legacy():
+    """Generates live `Math.random()` data with a legacy Node.js installed by nvm."""
+    nvm_script_path = "~/.nvm/nvm.sh"
+    node_path = (
+        subprocess.check_output(
+            ["bash", "-c", f"source {nvm_script_path} && nvm which v22.14"]
+        )
+        .decode("utf-8")
+        .strip()
+    )
+    yield from serve_v8_random(node_path)
+
+
+def generate_v8_random(converter, count, seed=0):
+    """Generates `count` values the way V8's `Math.random()` does, without Node.js.
+
+    V8 steps xorshift128+ to fill a cache of `CACHE_REFILL_SIZE` values at a time
+    and serves each cache in reverse order.
+    """
+    rng = random.Random(seed)
+    s0, s1 = rng.getrandbits(64), rng.getrandbits(64)
+    values = []
+    while len(values) < count:
+        cache = []
+        for _ in range(CACHE_REFILL_SIZE):
+            s0, s1 = XorShift128PlusUtil.next_state(s0, s1)
+            cache.append(converter.to_value(s0))
+        values.extend(reversed(cache))
+    return values[:count]
+
+
+def add_values_until_solved(cracker, sequence):
+    """Adds values from `sequence` until the cracker is solved and returns the rest."""
+    for i, val in enumerate(sequence):
+        if cracker.status == SolverStatus.SOLVED:
+            return sequence[i:]
+        cracker.add_value(val)
+    return []
+
+
 def test_binary_cast_converter():
     """Verifies that BinaryCastConverter's from_value inverts to_value."""
     # Use a known state where the lower 12 bits are zero
@@ -24,6 +98,28 @@ def test_binary_cast_converter():
     assert (original_state & ~0xFFF) == (recovered_state & ~0xFFF)
 
 
+def test_binary_cast_converter_matches_bit_cast():
+    """Verifies BinaryCastConverter against old V8's IEEE-754 bit cast."""
+
+    def bit_cast_to_value(state):
+        bits = (state >> 12) | 0x3FF0000000000000
+        return struct.unpack("<d", struct.pack("<Q", bits))[0] - 1.0
+
+    def bit_cast_from_value(value):
+        bits = struct.unpack("<Q", struct.pack("<d", value + 1.0))[0]
+        return (bits << 12) & UINT64_MASK
+
+    rng = random.Random(0)
+    states = [0, UINT64_MASK, 1 << 63, 0xFFF]
+    states += [rng.getrandbits(64) for _ in range(10000)]
+    values = [0.0, 2.0**-53, 0.5 - 2.0**-54, 1.0 - 2.0**-53]
+    values += [rng.random() for _ in range(10000)]
+    for state in states:
+        assert BinaryCastConverter.to_value(state) == bit_cast_to_value(state)
+    for value in values:
+        assert BinaryCastConverter.from_value(value) == bit_cast_from_value(value)
+
+
 def test_division_converter():
     """Verifies that DivisionConverter's from_value inverts to_value."""
     # Use a known state where the lower 11 bits are zero
@@ -45,6 +141,29 @@ def test_xor_shift_128_inverse():
     assert s1_orig == s1_recovered
 
 
+def test_xor_shift_128_jump_cache_refill():
+    """Verifies that jump_cache_refill matches stepping through a cache refill."""
+    for s0, s1 in [(0x123456789ABCDEF0, 0xFEDCBA9876543210), (1, 0), (0, 1 << 63)]:
+        expected = (s0, s1)
+        for _ in range(CACHE_REFILL_SIZE * 2):
+            expected = XorShift128PlusUtil.next_state(*expected)
+
+        assert XorShift128PlusUtil.jump_cache_refill(s0, s1) == expected
+
+
+def test_xor_shift_128_jump():
+    """Verifies that jump matches stepping the state forwards and backwards."""
+    s0, s1 = 0x123456789ABCDEF0, 0xFEDCBA9876543210
+    for steps in [0, 1, 2, 100, 1000]:
+        forward, backward = (s0, s1), (s0, s1)
+        for _ in range(steps):
+            forward = XorShift128PlusUtil.next_state(*forward)
+            backward = XorShift128PlusUtil.previous_state(*backward)
+
+        assert XorShift128PlusUtil.jump(s0, s1, steps) == forward
+        assert XorShift128PlusUtil.jump(s0, s1, -steps) == backward
+
+
 def test_v8_cracker_legacy():
     """Verifies the legacy cracker with a known sequence for old V8 versions."""
     observed_sequence = [
@@ -92,6 +211,7 @@ def test_v8_cracker():
         cracker.add_value(val)
 
     assert cracker.status == SolverStatus.SOLVED_BEFORE_CACHE_REFILL
+    assert [cracker.predict_at(i) for i in range(5)] == expected_predictions
     predictions = [cracker.predict_next() for _ in range(len(expected_predictions))]
     assert predictions == expected_predictions
 
@@ -133,19 +253,13 @@ def test_v8_cracker_int():
 
 
 @pytest.mark.repeat(10)
-def test_v8_cracker_with_live_data():
+def test_v8_cracker_with_live_data(v8_random):
     """Verifies the cracker against live data from a running Node.js process.
 
     This test provides strong evidence that the cracker works against a real-world
     V8 implementation. It is repeated to test against different random seeds.
     """
-    result = subprocess.run(
-        ["node", "sys_pseudo_rand_gen/v8_random.js", "30"],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    full_sequence = list(map(float, result.stdout.strip().split("\n")))
+    full_sequence = v8_random(30)
 
     observed_sequence = full_sequence[:5]
     expected_predictions = full_sequence[5:]
@@ -159,19 +273,13 @@ def test_v8_cracker_with_live_data():
     assert predictions == expected_predictions
 
 
-def test_v8_cracker_with_live_data_many():
+def test_v8_cracker_with_live_data_many(v8_random):
     """Verifies the cracker against live data from a running Node.js process.
 
     This test provides strong evidence that the cracker works against a real-world
     V8 implementation. It is repeated to test against different random seeds.
     """
-    result = subprocess.run(
-        ["node", "sys_pseudo_rand_gen/v8_random.js", "1000"],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    full_sequence = list(map(float, result.stdout.strip().split("\n")))
+    full_sequence = v8_random(1000)
 
     cracker = RandomCracker.create(RngType.V8)
     for val in full_sequence:
@@ -200,15 +308,103 @@ def test_v8_cracker_with_live_data_many():
     assert cracker.status == SolverStatus.NOT_SOLVABLE
 
 
-def test_cache_refilled_while_solving():
+@pytest.mark.parametrize(
+    "rng_type, converter",
+    [(RngType.V8, DivisionConverter), (RngType.V8_LEGACY, BinaryCastConverter)],
+)
+def test_cache_refilled_while_solving_generated_data(rng_type, converter):
+    """Verifies the cracker recovers from a cache refill during solving, without Node.js."""
+    full_sequence = generate_v8_random(converter, 300)
+
+    # Start 1-4 values before the end of the first cache.
+    for i in range(60, 64):
+        cracker = RandomCracker.create(rng_type)
+        statuses = set()
+        for val in full_sequence[i:]:
+            if cracker.status == SolverStatus.SOLVED:
+                assert cracker.predict_next() == val
+            else:
+                cracker.add_value(val)
+                statuses.add(cracker.status)
+        assert SolverStatus.CACHE_REFILLED_WHILE_SOLVING in statuses
+        assert cracker.status == SolverStatus.SOLVED
+
+
+@pytest.mark.parametrize(
+    "rng_type, converter",
+    [(RngType.V8, DivisionConverter), (RngType.V8_LEGACY, BinaryCastConverter)],
+)
+def test_v8_cracker_add_value_after_solved_generated_data(rng_type, converter):
+    """Verifies add_value across several cache refills once solved, without Node.js."""
+    full_sequence = generate_v8_random(converter, 1000, seed=2)
+
+    cracker = RandomCracker.create(rng_type)
+    for val in full_sequence:
+        cracker.add_value(val)
+    assert cracker.status == SolverStatus.SOLVED
+
+    # add invalid value
+    with pytest.raises(NotSolvableError):
+        cracker.add_value(0)
+    assert cracker.status == SolverStatus.NOT_SOLVABLE
+    with pytest.raises(NotSolvableError):
+        cracker.add_value(0)
+    assert cracker.status == SolverStatus.NOT_SOLVABLE
+
+
+@pytest.mark.parametrize(
+    "rng_type, converter",
+    [(RngType.V8, DivisionConverter), (RngType.V8_LEGACY, BinaryCastConverter)],
+)
+def test_v8_cracker_predict_many_matches_predict_next(rng_type, converter):
+    """Verifies that predict_many returns the same values as repeated predict_next."""
+    full_sequence = generate_v8_random(converter, 1000, seed=1)
+
+    cracker_many = RandomCracker.create(rng_type)
+    cracker_next = RandomCracker.create(rng_type)
+    expected_predictions = add_values_until_solved(cracker_many, full_sequence)
+    add_values_until_solved(cracker_next, full_sequence)
+    assert cracker_many.status == SolverStatus.SOLVED
+
+    # Batches of varying sizes that together cross several cache refills.
+    predictions = []
+    for count in [0, 1, 63, 64, 65, 200]:
+        batch = [cracker_next.predict_next() for _ in range(count)]
+        assert cracker_many.predict_many(count) == batch
+        predictions += batch
+    assert predictions == expected_predictions[: len(predictions)]
+
+
+@pytest.mark.parametrize("start", [0, 61])
+@pytest.mark.parametrize("skipped", [0, 1, 30, 59, 63])
+def test_v8_cracker_predict_at_after_cache_refill(start, skipped):
+    """Verifies predict_at against predict_next in the SOLVED state across refills."""
+    full_sequence = generate_v8_random(DivisionConverter, 1000, seed=2)[start:]
+
+    cracker = RandomCracker.create(RngType.V8)
+    add_values_until_solved(cracker, full_sequence)
+    assert cracker.status == SolverStatus.SOLVED
+    # Move the cache refill counter to a different phase.
+    for _ in range(skipped):
+        cracker.predict_next()
+
+    # 200 values span at least three cache refills, whatever the refill counter.
+    expected_predictions = [cracker.predict_at(i) for i in range(200)]
+    assert [cracker.predict_next() for _ in range(200)] == expected_predictions
+
+
+def test_v8_cracker_predict_at_negative_index():
+    """Verifies that predict_at rejects a negative index."""
+    cracker = RandomCracker.create(RngType.V8)
+    for val in generate_v8_random(DivisionConverter, 5):
+        cracker.add_value(val)
+    with pytest.raises(ValueError, match="index must be non-negative, got -1"):
+        cracker.predict_at(-1)
+
+
+def test_cache_refilled_while_solving(v8_random):
     """Verifies the cracker can recover after a cache refill occurs during solving."""
-    result = subprocess.run(
-        ["node", "sys_pseudo_rand_gen/v8_random.js", "1000"],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    full_sequence = list(map(float, result.stdout.strip().split("\n")))
+    full_sequence = v8_random(1000)
 
     for i in range(60, 64):
         cracker = RandomCracker.create(RngType.V8)
@@ -227,31 +423,13 @@ def test_cache_refilled_while_solving():
 #     "To run this test, You need to run `nvm install v22.14` to install a legacy Node.js version."
 # )
 @pytest.mark.repeat(10)
-def test_v8_cracker_legacy_with_live_data():
+def test_v8_cracker_legacy_with_live_data(v8_random_legacy):
     """Verifies the cracker against live data from a running Node.js process.
 
     This test provides strong evidence that the cracker works against a real-world
     V8 implementation. It is repeated to test against different random seeds.
     """
-    nvm_script_path = "~/.nvm/nvm.sh"
-    node_path = (
-        subprocess.check_output(
-            ["bash", "-c", f"source {nvm_script_path} && nvm which v22.14"]
-        )
-        .decode("utf-8")
-        .strip()
-    )
-    result = subprocess.run(
-        [
-            node_path,
-            "sys_pseudo_rand_gen/v8_random.js",
-            "30",
-        ],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    full_sequence = list(map(float, result.stdout.strip().split("\n")))
+    full_sequence = v8_random_legacy(30)
 
     observed_sequence = full_sequence[:5]
     expected_predictions = full_sequence[5:]
@@ -268,32 +446,13 @@ def test_v8_cracker_legacy_with_live_data():
 # @pytest.mark.skip(
 #     "To run this test, You need to run `nvm install v22.14` to install a legacy Node.js version."
 # )
-def test_v8_cracker_legacy_with_live_data_many():
+def test_v8_cracker_legacy_with_live_data_many(v8_random_legacy):
     """Verifies the cracker against live data from a running Node.js process.
 
     This test provides strong evidence that the cracker works against a real-world
     V8 implementation. It is repeated to test against different random seeds.
     """
-    nvm_script_path = "~/.nvm/nvm.sh"
-    node_path = (
-        subprocess.check_output(
-            ["bash", "-c", f"source {nvm_script_path} && nvm which v22.14"]
-        )
-        .decode("utf-8")
-        .strip()
-    )
-
-    result = subprocess.run(
-        [
-            node_path,
-            "sys_pseudo_rand_gen/v8_random.js",
-            "1000",
-        ],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    full_sequence = list(map(float, result.stdout.strip().split("\n")))
+    full_sequence = v8_random_legacy(1000)
 
     cracker = RandomCracker.create(RngType.V8_LEGACY)
     for val in full_sequence:
@@ -322,28 +481,9 @@ def test_v8_cracker_legacy_with_live_data_many():
     assert cracker.status == SolverStatus.NOT_SOLVABLE
 
 
-def test_cache_refilled_while_solving_legacy():
+def test_cache_refilled_while_solving_legacy(v8_random_legacy):
     """Verifies the cracker can recover after a cache refill occurs during solving."""
-    nvm_script_path = "~/.nvm/nvm.sh"
-    node_path = (
-        subprocess.check_output(
-            ["bash", "-c", f"source {nvm_script_path} && nvm which v22.14"]
-        )
-        .decode("utf-8")
-        .strip()
-    )
-
-    result = subprocess.run(
-        [
-            node_path,
-            "sys_pseudo_rand_gen/v8_random.js",
-            "1000",
-        ],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    full_sequence = list(map(float, result.stdout.strip().split("\n")))
+    full_sequence = v8_random_legacy(1000)
 
     for i in range(60, 64):
         cracker = RandomCracker.create(RngType.V8_LEGACY)